@@ -18,5 +18,5 @@
 # =============================================================================
 
 
-from .gui.canvasPanel import graphFrame_enabled
+from .gui.canvasPanel import graphFrameAvailable
 from .gui.frame import GraphFrame
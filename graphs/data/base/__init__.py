@@ -20,4 +20,4 @@
 from .cache import FitDataCache
 from .defs import XDef, YDef, VectorDef, Input, InputCheckbox
 from .getter import PointGetter, SmoothPointGetter
-from .graph import FitGraph
+from .graph import FitGraph, isCacheKeyAffected
@@ -26,6 +26,21 @@ from eos.utils.float import floatUnerr
 from service.const import GraphCacheCleanupReason
 
 
+def isCacheKeyAffected(reason, extraData, fitID, tgtType, tgtID):
+    """Check if data cached for (fit ID, target type, target ID) is invalidated by cleanup."""
+    # If fit changed - clear plots which concern this fit
+    if reason in (GraphCacheCleanupReason.fitChanged, GraphCacheCleanupReason.fitRemoved):
+        return extraData == fitID or (tgtType == 'fit' and extraData == tgtID)
+    # Same for profile
+    if reason in (GraphCacheCleanupReason.profileChanged, GraphCacheCleanupReason.profileRemoved):
+        return tgtType == 'profile' and extraData == tgtID
+    # Target fit resist mode changed
+    if reason == GraphCacheCleanupReason.resistModeChanged:
+        return tgtType == 'fit' and extraData == tgtID
+    # Wipe out whole cache otherwise
+    return True
+
+
 class FitGraph(metaclass=ABCMeta):
 
     # UI stuff
@@ -114,43 +129,9 @@ class FitGraph(metaclass=ABCMeta):
         return y
 
     def clearCache(self, reason, extraData=None):
-        caches = (self._plotCache, self._pointCache)
-        plotKeysToClear = set()
-        # If fit changed - clear plots which concern this fit
-        if reason in (GraphCacheCleanupReason.fitChanged, GraphCacheCleanupReason.fitRemoved):
-            for cache in caches:
-                for cacheKey in cache:
-                    cacheFitID, cacheTgtType, cacheTgtID = cacheKey
-                    if extraData == cacheFitID:
-                        plotKeysToClear.add(cacheKey)
-                    elif cacheTgtType == 'fit' and extraData == cacheTgtID:
-                        plotKeysToClear.add(cacheKey)
-        # Same for profile
-        elif reason in (GraphCacheCleanupReason.profileChanged, GraphCacheCleanupReason.profileRemoved):
-            for cache in caches:
-                for cacheKey in cache:
-                    cacheFitID, cacheTgtType, cacheTgtID = cacheKey
-                    if cacheTgtType == 'profile' and extraData == cacheTgtID:
-                        plotKeysToClear.add(cacheKey)
-        # Target fit resist mode changed
-        elif reason == GraphCacheCleanupReason.resistModeChanged:
-            for cache in caches:
-                for cacheKey in cache:
-                    cacheFitID, cacheTgtType, cacheTgtID = cacheKey
-                    if cacheTgtType == 'fit' and extraData == cacheTgtID:
-                        plotKeysToClear.add(cacheKey)
-        # Wipe out whole plot cache otherwise
-        else:
-            for cache in caches:
-                for cacheKey in cache:
-                    plotKeysToClear.add(cacheKey)
-        # Do actual cleanup
-        for cache in caches:
-            for cacheKey in plotKeysToClear:
-                try:
-                    del cache[cacheKey]
-                except KeyError:
-                    pass
+        for cache in (self._plotCache, self._pointCache):
+            for cacheKey in [k for k in cache if isCacheKeyAffected(reason, extraData, *k)]:
+                del cache[cacheKey]
         # Process any internal caches graphs might have
         self._clearInternalCache(reason, extraData)
 
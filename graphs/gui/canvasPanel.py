@@ -18,18 +18,18 @@
 # =============================================================================
 
 
+import importlib.metadata
+import importlib.util
 import itertools
-import math
 import os
 import traceback
-from bisect import bisect
-
 
 # noinspection PyPackageRequirements
 import wx
 from logbook import Logger
 
 
+from graphs.gui.limits import getLimits
 from graphs.style import BASE_COLORS, LIGHTNESSES, STYLES, hsl_to_hsv
 from gui.utils.numberFormatter import roundToPrec
 
@@ -37,136 +37,212 @@ from gui.utils.numberFormatter import roundToPrec
 pyfalog = Logger(__name__)
 
 
-try:
-    import matplotlib as mpl
-
-    mpl_version = int(mpl.__version__[0]) or -1
-    if mpl_version >= 2:
-        mpl.use('wxagg')
-        graphFrame_enabled = True
-    else:
-        graphFrame_enabled = False
-
-    from matplotlib.lines import Line2D
-    from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as Canvas
-    from matplotlib.figure import Figure
-    from matplotlib.colors import hsv_to_rgb
-except ImportError as e:
-    pyfalog.warning('Matplotlib failed to import.  Likely missing or incompatible version.')
-    graphFrame_enabled = False
-except (KeyboardInterrupt, SystemExit):
-    raise
-except Exception:
-    # We can get exceptions deep within matplotlib. Catch those.  See GH #1046
-    tb = traceback.format_exc()
-    pyfalog.critical('Exception when importing Matplotlib. Continuing without importing.')
-    pyfalog.critical(tb)
-    graphFrame_enabled = False
+# Matplotlib takes a while to import, so it is imported only when graphs
+# are actually requested. Names below are populated by importMatplotlib()
+mpl = np = None
+LineCollection = Line2D = Canvas = Figure = hsv_to_rgb = None
+_mplEnabled = None
+
+
+def graphFrameAvailable():
+    """Check if graphs can be shown without importing matplotlib."""
+    if _mplEnabled is not None:
+        return _mplEnabled
+    if importlib.util.find_spec('matplotlib') is None:
+        return False
+    try:
+        return int(importlib.metadata.version('matplotlib').split('.')[0]) >= 2
+    # Metadata might be missing in frozen builds, actual import will tell then
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return True
+
+
+def importMatplotlib():
+    """Import matplotlib on first call, and report if graphs can be drawn."""
+    global _mplEnabled, mpl, np, LineCollection, Line2D, Canvas, Figure, hsv_to_rgb
+    if _mplEnabled is not None:
+        return _mplEnabled
+    try:
+        import matplotlib as mpl
+        import numpy as np
+
+        mpl_version = int(mpl.__version__[0]) or -1
+        if mpl_version >= 2:
+            mpl.use('wxagg')
+            # Let renderer drop vertices which do not change picture, and
+            # split very long paths to avoid agg limits on their length
+            mpl.rcParams['path.simplify'] = True
+            mpl.rcParams['path.simplify_threshold'] = 1.0
+            mpl.rcParams['agg.path.chunksize'] = 10000
+            _mplEnabled = True
+        else:
+            _mplEnabled = False
+
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+        from matplotlib.backends.backend_wxagg import FigureCanvasWxAgg as Canvas
+        from matplotlib.figure import Figure
+        from matplotlib.colors import hsv_to_rgb
+    except ImportError as e:
+        pyfalog.warning('Matplotlib failed to import.  Likely missing or incompatible version.')
+        _mplEnabled = False
+    except (KeyboardInterrupt, SystemExit):
+        raise
+    except Exception:
+        # We can get exceptions deep within matplotlib. Catch those.  See GH #1046
+        tb = traceback.format_exc()
+        pyfalog.critical('Exception when importing Matplotlib. Continuing without importing.')
+        pyfalog.critical(tb)
+        _mplEnabled = False
+    return _mplEnabled
 
 
 class GraphCanvasPanel(wx.Panel):
 
+    _fontCachePurged = False
+    # Figure and canvas are expensive to create, so they are
+    # kept around between graph window open/close cycles
+    _cachedFigure = None
+    _cachedCanvas = None
+    _canvasHolder = None
+
     def __init__(self, graphFrame, parent):
         super().__init__(parent)
         self.graphFrame = graphFrame
 
-        # Remove matplotlib font cache, see #234
-        try:
-            cache_dir = mpl._get_cachedir()
-        except (KeyboardInterrupt, SystemExit):
-            raise
-        except:
-            cache_dir = os.path.expanduser(os.path.join('~', '.matplotlib'))
-        cache_file = os.path.join(cache_dir, 'fontList.cache')
-        if os.access(cache_dir, os.W_OK | os.X_OK) and os.path.isfile(cache_file):
-            os.remove(cache_file)
+        # Remove matplotlib font cache, see #234. Do it only once per
+        # process, otherwise matplotlib rebuilds it on every graph window open
+        if not GraphCanvasPanel._fontCachePurged:
+            try:
+                cache_dir = mpl._get_cachedir()
+            except (KeyboardInterrupt, SystemExit):
+                raise
+            except:
+                cache_dir = os.path.expanduser(os.path.join('~', '.matplotlib'))
+            cache_file = os.path.join(cache_dir, 'fontList.cache')
+            if os.access(cache_dir, os.W_OK | os.X_OK) and os.path.isfile(cache_file):
+                os.remove(cache_file)
+            GraphCanvasPanel._fontCachePurged = True
 
         mainSizer = wx.BoxSizer(wx.VERTICAL)
 
-        self.figure = Figure(figsize=(5, 3), tight_layout={'pad': 1.08})
-        rgbtuple = wx.SystemSettings.GetColour(wx.SYS_COLOUR_BTNFACE).Get()
-        clr = [c / 255. for c in rgbtuple]
-        self.figure.set_facecolor(clr)
-        self.figure.set_edgecolor(clr)
-        self.canvas = Canvas(self, -1, self.figure)
-        self.canvas.SetBackgroundColour(wx.Colour(*rgbtuple))
-        self.canvas.mpl_connect('button_press_event', self.OnMplCanvasClick)
-        self.subplot = self.figure.add_subplot(111)
-        self.subplot.grid(True)
+        # Destroyed wx windows evaluate to False
+        if GraphCanvasPanel._cachedCanvas:
+            self.figure = GraphCanvasPanel._cachedFigure
+            self.canvas = GraphCanvasPanel._cachedCanvas
+            self.canvas.Reparent(self)
+            self.subplot = self.figure.axes[0]
+        else:
+            self.figure = Figure(figsize=(5, 3), tight_layout={'pad': 1.08})
+            rgbtuple = wx.SystemSettings.GetColour(wx.SYS_COLOUR_BTNFACE).Get()
+            clr = [c / 255. for c in rgbtuple]
+            self.figure.set_facecolor(clr)
+            self.figure.set_edgecolor(clr)
+            self.canvas = Canvas(self, -1, self.figure)
+            self.canvas.SetBackgroundColour(wx.Colour(*rgbtuple))
+            self.subplot = self.figure.add_subplot(111)
+            self.subplot.grid(True)
+            GraphCanvasPanel._cachedFigure = self.figure
+            GraphCanvasPanel._cachedCanvas = self.canvas
+        self.mplHandlers = [
+            self.canvas.mpl_connect('button_press_event', self.OnMplCanvasClick),
+            self.canvas.mpl_connect('draw_event', self.OnMplCanvasDraw),
+            self.canvas.mpl_connect('resize_event', self.OnMplCanvasResize)]
         mainSizer.Add(self.canvas, 1, wx.EXPAND | wx.ALL, 0)
 
         self.SetSizer(mainSizer)
 
         self.xMark = None
+        # Legend is drawn on top of cached background, to be able to toggle it without full redraw
+        self.legend = None
+        self.background = None
+        # Format: {(color ID, lightness ID, line style ID): (RGB color, line style)}
+        self._styleCache = {}
+        # Format: {(color, line style, label): Line2D}
+        self._legendLineCache = {}
+        self._lastStateKey = None
+        self._forceRedraw = False
+        # Format: {(color, line style): LineCollection}; None means
+        # we do not know what is on the plot, and it has to be rebuilt
+        self._lineCollections = None
+        # X mark lines, labels and single-point markers
+        self._decorations = []
         self.mplOnDragHandler = None
         self.mplOnReleaseHandler = None
 
     def draw(self, accurateMarks=True):
-        self.subplot.clear()
-        self.subplot.grid(True)
-        allXs = set()
-        allYs = set()
-        plotData = {}
-        legendData = []
         chosenX = self.graphFrame.ctrlPanel.xType
         chosenY = self.graphFrame.ctrlPanel.yType
-        self.subplot.set(
-            xlabel=self.graphFrame.ctrlPanel.formatLabel(chosenX),
-            ylabel=self.graphFrame.ctrlPanel.formatLabel(chosenY))
-
         mainInput, miscInputs = self.graphFrame.ctrlPanel.getValues()
         view = self.graphFrame.getView()
         sources = self.graphFrame.ctrlPanel.sources
+        targets = self.graphFrame.ctrlPanel.targets if view.hasTargets else ()
+
+        # Having more than couple of points per pixel doesn't change what is drawn
+        maxPoints = max(2, int(2 * self.subplot.bbox.width))
+
+        # Skip redraw if nothing which affects the picture has changed
+        stateKey = (
+            view.internalName, mainInput, tuple(miscInputs), chosenX, chosenY,
+            tuple((id(s.item), s.colorID, s.shortName) for s in sources),
+            tuple((id(t.item), t.lightnessID, t.lineStyleID, t.resistMode, t.shortName) for t in targets),
+            self.graphFrame.ctrlPanel.showLegend, self.graphFrame.ctrlPanel.showY0,
+            self.xMark, accurateMarks, maxPoints)
+        if stateKey == self._lastStateKey and not self._forceRedraw:
+            return
+        self._lastStateKey = None
+        self._forceRedraw = False
+
+        self._removeDecorations()
+        minX = minY = np.inf
+        maxX = maxY = -np.inf
+        plotData = {}
+        legendData = []
+        # Format: {(color, line style): [segment, ...]}
+        lineSegments = {}
+        # Single data points, format: [(x, y, color), ...]
+        points = []
+
         if view.hasTargets:
-            iterList = tuple(itertools.product(sources, self.graphFrame.ctrlPanel.targets))
+            iterList = itertools.product(sources, targets)
         else:
-            iterList = tuple((f, None) for f in sources)
+            iterList = ((f, None) for f in sources)
 
         # Draw plot lines and get data for legend
         for source, target in iterList:
             # Get line style data
-            try:
-                colorData = BASE_COLORS[source.colorID]
-            except KeyError:
-                pyfalog.warning('Invalid color "{}" for "{}"'.format(source.colorID, source.name))
+            style = self._resolveStyle(source, target)
+            if style is None:
                 continue
-            color = colorData.hsl
-            lineStyle = 'solid'
-            if target is not None:
-                try:
-                    lightnessData = LIGHTNESSES[target.lightnessID]
-                except KeyError:
-                    pyfalog.warning('Invalid lightness "{}" for "{}"'.format(target.lightnessID, target.name))
-                    continue
-                color = lightnessData.func(color)
-                try:
-                    lineStyleData = STYLES[target.lineStyleID]
-                except KeyError:
-                    pyfalog.warning('Invalid line style "{}" for "{}"'.format(target.lightnessID, target.name))
-                    continue
-                lineStyle = lineStyleData.mplSpec
-            color = hsv_to_rgb(hsl_to_hsv(color))
+            color, lineStyle = style
 
-            # Get point data
+            # Get point data; it is calculated sequentially, since eos calculations
+            # are pure Python (so threads would not help due to GIL) and are not thread-safe
             try:
-                xs, ys = view.getPlotPoints(
+                xs, ys = self.graphFrame.getPlotPoints(
                     mainInput=mainInput,
                     miscInputs=miscInputs,
                     xSpec=chosenX,
                     ySpec=chosenY,
                     src=source,
                     tgt=target)
+                xs = np.asarray(xs, dtype=float)
+                ys = np.asarray(ys, dtype=float)
                 if not self.__checkNumbers(xs, ys):
                     pyfalog.warning('Failed to plot "{}" vs "{}" due to inf or NaN in values'.format(source.name, '' if target is None else target.name))
                     continue
                 plotData[(source, target)] = (xs, ys)
-                allXs.update(xs)
-                allYs.update(ys)
+                if xs.size:
+                    minX = min(minX, xs.min())
+                    maxX = max(maxX, xs.max())
+                if ys.size:
+                    minY = min(minY, ys.min())
+                    maxY = max(maxY, ys.max())
                 # If we have single data point, show marker - otherwise line won't be shown
-                if len(xs) == 1 and len(ys) == 1:
-                    self.subplot.plot(xs, ys, color=color, linestyle=lineStyle, marker='.')
+                if xs.size == 1 and ys.size == 1:
+                    points.append((xs[0], ys[0], color))
                 else:
-                    self.subplot.plot(xs, ys, color=color, linestyle=lineStyle)
+                    lineSegments.setdefault((color, lineStyle), []).append(self._makeSegment(xs, ys, maxPoints))
                 # Fill data for legend
                 if target is None:
                     legendData.append((color, lineStyle, source.shortName))
@@ -176,25 +252,27 @@ class GraphCanvasPanel(wx.Panel):
                 raise
             except Exception:
                 pyfalog.warning('Failed to plot "{}" vs "{}"'.format(source.name, '' if target is None else target.name))
+                self._updateLines(lineSegments, points)
+                self._setLabels(chosenX, chosenY)
                 self.canvas.draw()
                 self.Refresh()
                 return
 
+        self._updateLines(lineSegments, points)
+        self._setLabels(chosenX, chosenY)
+
         # Setting Y limits for canvas
         if self.graphFrame.ctrlPanel.showY0:
-            allYs.add(0)
-        canvasMinY, canvasMaxY = self._getLimits(allYs, minExtra=0.05, maxExtra=0.1)
-        canvasMinX, canvasMaxX = self._getLimits(allXs, minExtra=0.02, maxExtra=0.02)
+            minY = min(minY, 0)
+            maxY = max(maxY, 0)
+        canvasMinY, canvasMaxY = getLimits(minY, maxY, minExtra=0.05, maxExtra=0.1)
+        canvasMinX, canvasMaxX = getLimits(minX, maxX, minExtra=0.02, maxExtra=0.02)
         self.subplot.set_ylim(bottom=canvasMinY, top=canvasMaxY)
         self.subplot.set_xlim(left=canvasMinX, right=canvasMaxX)
         # Process X marks line
         if self.xMark is not None:
-            minX = min(allXs, default=None)
-            maxX = max(allXs, default=None)
-            if minX is not None and maxX is not None:
-                minY = min(allYs, default=None)
-                maxY = max(allYs, default=None)
-                yDiff = (maxY or 0) - (minY or 0)
+            if np.isfinite(minX) and np.isfinite(maxX):
+                yDiff = (maxY if np.isfinite(maxY) else 0) - (minY if np.isfinite(minY) else 0)
                 xMark = max(min(self.xMark, maxX), minX)
                 # If in top 10% of X coordinates, align labels differently
                 if xMark > canvasMinX + 0.9 * (canvasMaxX - canvasMinX):
@@ -206,15 +284,15 @@ class GraphCanvasPanel(wx.Panel):
                     labelPrefix = ' '
                     labelSuffix = ''
                 # Draw line
-                self.subplot.axvline(x=xMark, linestyle='dotted', linewidth=1, color=(0, 0, 0))
+                self._decorations.append(self.subplot.axvline(x=xMark, linestyle='dotted', linewidth=1, color=(0, 0, 0)))
                 # Draw its X position
                 if chosenX.unit is None:
                     xLabel = '{}{}{}'.format(labelPrefix, roundToPrec(xMark, 4), labelSuffix)
                 else:
                     xLabel = '{}{} {}{}'.format(labelPrefix, roundToPrec(xMark, 4), chosenX.unit, labelSuffix)
-                self.subplot.annotate(
+                self._decorations.append(self.subplot.annotate(
                     xLabel, xy=(xMark, canvasMaxY - 0.01 * (canvasMaxY - canvasMinY)), xytext=(0, 0), annotation_clip=False,
-                    textcoords='offset pixels', ha=labelAlignment, va='top', fontsize='small')
+                    textcoords='offset pixels', ha=labelAlignment, va='top', fontsize='small'))
                 # Get Y values
                 yMarks = set()
 
@@ -232,9 +310,8 @@ class GraphCanvasPanel(wx.Panel):
                     if minY <= val <= maxY or minY <= rounded <= maxY:
                         yMarks.add(rounded)
 
-                for source, target in iterList:
-                    xs, ys = plotData[(source, target)]
-                    if not xs or xMark < min(xs) or xMark > max(xs):
+                for (source, target), (xs, ys) in plotData.items():
+                    if not xs.size or xMark < xs.min() or xMark > xs.max():
                         continue
                     # Fetch values from graphs when we're asked to provide accurate data
                     if accurateMarks:
@@ -255,35 +332,75 @@ class GraphCanvasPanel(wx.Panel):
                             continue
                     # Otherwise just do linear interpolation between two points
                     else:
-                        if xMark in xs:
+                        matches = np.flatnonzero(xs == xMark)
+                        if matches.size:
                             # We might have multiples of the same value in our sequence, pick value for the last one
-                            idx = len(xs) - xs[::-1].index(xMark) - 1
-                            addYMark(ys[idx])
+                            addYMark(ys[matches[-1]])
                             continue
-                        idx = bisect(xs, xMark)
+                        idx = np.searchsorted(xs, xMark, side='right')
                         yMark = self._interpolateX(x=xMark, x1=xs[idx - 1], y1=ys[idx - 1], x2=xs[idx], y2=ys[idx])
                         addYMark(yMark)
 
                 # Draw Y values
                 for yMark in yMarks:
-                    self.subplot.annotate(
+                    self._decorations.append(self.subplot.annotate(
                         '{}{}{}'.format(labelPrefix, yMark, labelSuffix), xy=(xMark, yMark), xytext=(0, 0),
-                        textcoords='offset pixels', ha=labelAlignment, va='center', fontsize='small')
+                        textcoords='offset pixels', ha=labelAlignment, va='center', fontsize='small'))
 
+        # Reuse legend proxy lines from previous draw, keeping only those which are still shown
         legendLines = []
-        for i, iData in enumerate(legendData):
-            color, lineStyle, label = iData
-            legendLines.append(Line2D([0], [0], color=color, linestyle=lineStyle, label=label.replace('$', '\$')))
+        legendLineCache = {}
+        for legendKey in legendData:
+            try:
+                legendLine = self._legendLineCache[legendKey]
+            except KeyError:
+                color, lineStyle, label = legendKey
+                legendLine = Line2D([0], [0], color=color, linestyle=lineStyle, label=label.replace('$', '\$'))
+            legendLineCache[legendKey] = legendLine
+            legendLines.append(legendLine)
+        self._legendLineCache = legendLineCache
 
-        if len(legendLines) > 0 and self.graphFrame.ctrlPanel.showLegend:
+        if len(legendLines) > 0:
             legend = self.subplot.legend(handles=legendLines)
             for t in legend.get_texts():
                 t.set_fontsize('small')
             for l in legend.get_lines():
                 l.set_linewidth(1)
+            # Exclude legend from regular draws, it's blitted over background
+            legend.set_animated(True)
+            self.legend = legend
 
         self.canvas.draw()
         self.Refresh()
+        self._lastStateKey = stateKey
+
+    def releaseCanvas(self):
+        # Move canvas to hidden holder window, to be picked up by the next graph window
+        for handler in (*self.mplHandlers, self.mplOnDragHandler, self.mplOnReleaseHandler):
+            if handler:
+                self.canvas.mpl_disconnect(handler)
+        self.mplHandlers = []
+        self.mplOnDragHandler = None
+        self.mplOnReleaseHandler = None
+        if not GraphCanvasPanel._canvasHolder:
+            GraphCanvasPanel._canvasHolder = wx.Frame(self.graphFrame.mainFrame)
+        self.GetSizer().Detach(self.canvas)
+        self.canvas.Reparent(GraphCanvasPanel._canvasHolder)
+
+    def markDirty(self):
+        self._forceRedraw = True
+
+    def refreshLegend(self):
+        if self.background is None:
+            self.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._drawAnimated()
+        self.canvas.blit(self.subplot.bbox)
+
+    def _drawAnimated(self):
+        if self.legend is not None and self.graphFrame.ctrlPanel.showLegend:
+            self.subplot.draw_artist(self.legend)
 
     def markXApproximate(self, x):
         if x is not None:
@@ -294,23 +411,84 @@ class GraphCanvasPanel(wx.Panel):
         self.xMark = None
         self.draw()
 
+    def _updateLines(self, lineSegments, points):
+        # If we have the same set of line styles as during previous draw, just
+        # update data of existing artists instead of rebuilding the whole plot
+        if self._lineCollections is not None and self._lineCollections.keys() == lineSegments.keys():
+            for styleKey, segments in lineSegments.items():
+                self._lineCollections[styleKey].set_segments(segments)
+        else:
+            self.subplot.clear()
+            self.subplot.grid(True)
+            self._lineCollections = {}
+            # Lines of the same style are batched into single collection to avoid per-artist overhead
+            for (color, lineStyle), segments in lineSegments.items():
+                lineCollection = LineCollection(segments, colors=[color], linestyles=[lineStyle])
+                self.subplot.add_collection(lineCollection)
+                self._lineCollections[(color, lineStyle)] = lineCollection
+        if points:
+            xs, ys, colors = zip(*points)
+            self._decorations.append(self.subplot.scatter(xs, ys, c=colors, marker='.'))
+
+    def _removeDecorations(self):
+        # Remove artists which are not reused between draws
+        if self.legend is not None:
+            self.legend.remove()
+            self.legend = None
+        for artist in self._decorations:
+            artist.remove()
+        self._decorations = []
+
+    def _setLabels(self, chosenX, chosenY):
+        self.subplot.set(
+            xlabel=self.graphFrame.ctrlPanel.formatLabel(chosenX),
+            ylabel=self.graphFrame.ctrlPanel.formatLabel(chosenY))
+
     @staticmethod
-    def _getLimits(vals, minExtra=0, maxExtra=0):
-        minVal = min(vals, default=0)
-        maxVal = max(vals, default=0)
-        # Extend range a little for some visual space
-        valRange = maxVal - minVal
-        minVal -= valRange * minExtra
-        maxVal += valRange * maxExtra
-        # Extend by % of value if we show function of a constant
-        if minVal == maxVal:
-            minVal -= minVal * 0.05
-            maxVal += minVal * 0.05
-        # If still equal, function is 0, spread out visual space as special case
-        if minVal == maxVal:
-            minVal -= 5
-            maxVal += 5
-        return minVal, maxVal
+    def _makeSegment(xs, ys, maxPoints):
+        if len(xs) > maxPoints:
+            # Keep every n-th point, and always keep the last one
+            stride = int(np.ceil(len(xs) / maxPoints))
+            xs = np.append(xs[:-1:stride], xs[-1])
+            ys = np.append(ys[:-1:stride], ys[-1])
+        return np.column_stack((xs, ys))
+
+    def _resolveStyle(self, source, target):
+        if target is None:
+            cacheKey = (source.colorID, None, None)
+        else:
+            cacheKey = (source.colorID, target.lightnessID, target.lineStyleID)
+        try:
+            return self._styleCache[cacheKey]
+        except KeyError:
+            pass
+        # Palette is static, so failures are cached as well - this way we warn only once
+        style = self._styleCache[cacheKey] = self.__calcStyle(source, target)
+        return style
+
+    @staticmethod
+    def __calcStyle(source, target):
+        try:
+            colorData = BASE_COLORS[source.colorID]
+        except KeyError:
+            pyfalog.warning('Invalid color "{}" for "{}"'.format(source.colorID, source.name))
+            return None
+        color = colorData.hsl
+        lineStyle = 'solid'
+        if target is not None:
+            try:
+                lightnessData = LIGHTNESSES[target.lightnessID]
+            except KeyError:
+                pyfalog.warning('Invalid lightness "{}" for "{}"'.format(target.lightnessID, target.name))
+                return None
+            color = lightnessData.func(color)
+            try:
+                lineStyleData = STYLES[target.lineStyleID]
+            except KeyError:
+                pyfalog.warning('Invalid line style "{}" for "{}"'.format(target.lineStyleID, target.name))
+                return None
+            lineStyle = lineStyleData.mplSpec
+        return tuple(hsv_to_rgb(hsl_to_hsv(color))), lineStyle
 
     @staticmethod
     def _interpolateX(x, x1, y1, x2, y2):
@@ -320,12 +498,19 @@ class GraphCanvasPanel(wx.Panel):
 
     @staticmethod
     def __checkNumbers(xs, ys):
-        for number in itertools.chain(xs, ys):
-            if math.isnan(number) or math.isinf(number):
-                return False
-        return True
+        return bool(np.isfinite(xs).all() and np.isfinite(ys).all())
 
     # Matplotlib event handlers
+    def OnMplCanvasDraw(self, event):
+        # Full draws happen not only on our request, but on resize too -
+        # refresh background and draw legend on top of it
+        self.background = self.canvas.copy_from_bbox(self.subplot.bbox)
+        self._drawAnimated()
+
+    def OnMplCanvasResize(self, event):
+        # Lines are downsampled to axes width, recalculate them for new size
+        self.graphFrame.scheduleDraw()
+
     def OnMplCanvasClick(self, event):
         if event.button == 1:
             if not self.mplOnDragHandler:
@@ -47,6 +47,8 @@ class GraphControlPanel(wx.Panel):
         self._inputCheckboxes = []
         self._storedRanges = {}
         self._storedConsts = {}
+        # Format: {(axis or input definition, selector flag): label}
+        self._labelCache = {}
 
         mainSizer = wx.BoxSizer(wx.VERTICAL)
         optsSizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -317,7 +319,7 @@ class GraphControlPanel(wx.Panel):
 
     def OnShowLegendChange(self, event):
         event.Skip()
-        self.graphFrame.draw()
+        self.graphFrame.refreshLegend()
 
     def OnShowY0Change(self, event):
         event.Skip()
@@ -443,10 +445,16 @@ class GraphControlPanel(wx.Panel):
         self.targetList.OnResistModeChanged(event)
 
     def formatLabel(self, axisDef, selector=False):
+        cacheKey = (axisDef, selector)
+        try:
+            return self._labelCache[cacheKey]
+        except KeyError:
+            pass
         label = axisDef.selectorLabel if selector else axisDef.label
-        if axisDef.unit is None:
-            return label
-        return '{}, {}'.format(label, axisDef.unit)
+        if axisDef.unit is not None:
+            label = '{}, {}'.format(label, axisDef.unit)
+        self._labelCache[cacheKey] = label
+        return label
 
     def _storeCurrentValues(self):
         main, misc = self.getValues()
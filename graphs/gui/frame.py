@@ -25,7 +25,7 @@ from logbook import Logger
 import gui.display
 import gui.globalEvents as GE
 import gui.mainFrame
-from graphs.data.base import FitGraph
+from graphs.data.base import FitGraph, isCacheKeyAffected
 from graphs.events import RESIST_MODE_CHANGED
 from gui.auxFrame import AuxiliaryFrame
 from gui.bitmap_loader import BitmapLoader
@@ -39,17 +39,21 @@ pyfalog = Logger(__name__)
 
 
 REDRAW_DELAY = 500
+COALESCE_DELAY = 30
+PLOT_CACHE_SIZE = 200
 
 
 class GraphFrame(AuxiliaryFrame):
 
     def __init__(self, parent, includeHidden=False):
-        if not canvasPanel.graphFrame_enabled:
+        if not canvasPanel.importMatplotlib():
             pyfalog.warning('Matplotlib is not enabled. Skipping initialization.')
             return
 
         super().__init__(parent, title='Graphs', size=(520, 390), resizeable=True)
         self.mainFrame = gui.mainFrame.MainFrame.getInstance()
+        # Format: {(view name, main input, misc inputs, xSpec, ySpec, fit ID, target type, target ID, resist mode): (xs, ys)}
+        self._plotPointCache = {}
 
         self.SetIcon(wx.Icon(BitmapLoader.getBitmap('graphs_small', 'gui')))
 
@@ -76,25 +80,21 @@ class GraphFrame(AuxiliaryFrame):
         for view in FitGraph.views:
             if view.hidden and not includeHidden:
                 continue
-            self.graphSelection.Append(view.name, view())
+            # Views are instantiated on first access, see getView()
+            self.graphSelection.Append(view.name, view)
         self.graphSelection.SetSelection(0)
         self.ctrlPanel.updateControls(layout=False)
 
         # Event bindings - local events
         self.Bind(wx.EVT_CLOSE, self.OnClose)
         self.Bind(wx.EVT_CHAR_HOOK, self.kbEvent)
+        self.Bind(wx.EVT_SHOW, self.OnShow)
 
         # Event bindings - external events
-        self.mainFrame.Bind(GE.FIT_RENAMED, self.OnFitRenamed)
-        self.mainFrame.Bind(GE.FIT_CHANGED, self.OnFitChanged)
-        self.mainFrame.Bind(GE.FIT_REMOVED, self.OnFitRemoved)
-        self.mainFrame.Bind(GE.TARGET_PROFILE_RENAMED, self.OnProfileRenamed)
-        self.mainFrame.Bind(GE.TARGET_PROFILE_CHANGED, self.OnProfileChanged)
-        self.mainFrame.Bind(GE.TARGET_PROFILE_REMOVED, self.OnProfileRemoved)
-        self.mainFrame.Bind(RESIST_MODE_CHANGED, self.OnResistModeChanged)
-        self.mainFrame.Bind(GE.GRAPH_OPTION_CHANGED, self.OnGraphOptionChanged)
-        self.mainFrame.Bind(GE.EFFECTIVE_HP_TOGGLED, self.OnEffectiveHpToggled)
+        self._bindExternal()
 
+        # Drawing is postponed while window is not shown
+        self._drawPending = False
         self.drawTimer = wx.Timer(self)
         self.Bind(wx.EVT_TIMER, self.OnDrawTimer, self.drawTimer)
 
@@ -104,8 +104,16 @@ class GraphFrame(AuxiliaryFrame):
 
     @classmethod
     def openOne(cls, parent, *args, **kwargs):
-        if canvasPanel.graphFrame_enabled:
+        if canvasPanel.importMatplotlib():
             super().openOne(parent, *args, **kwargs)
+            return
+        # Matplotlib is broken - stop offering graphs for the rest of the session
+        menuBar = gui.mainFrame.MainFrame.getInstance().GetMenuBar()
+        if menuBar is not None:
+            menuBar.Enable(menuBar.graphFrameId, False)
+        wx.MessageBox(
+            "Graphs are unavailable: matplotlib failed to import. Make sure matplotlib 2.0 or newer is installed.",
+            "Error", wx.ICON_ERROR | wx.STAY_ON_TOP)
 
     def UpdateWindowSize(self):
         curW, curH = self.GetSize()
@@ -127,7 +135,7 @@ class GraphFrame(AuxiliaryFrame):
     def OnFitRenamed(self, event):
         event.Skip()
         self.ctrlPanel.OnFitRenamed(event)
-        self.draw()
+        self.scheduleDraw()
 
     def OnFitChanged(self, event):
         event.Skip()
@@ -136,39 +144,38 @@ class GraphFrame(AuxiliaryFrame):
         self.ctrlPanel.OnFitChanged(event)
         # Data has to be recalculated - delay redraw
         # to give time to finish UI update in main window
-        self.drawTimer.Stop()
-        self.drawTimer.Start(REDRAW_DELAY, True)
+        self.scheduleDraw(REDRAW_DELAY)
 
     def OnFitRemoved(self, event):
         event.Skip()
         self.clearCache(reason=GraphCacheCleanupReason.fitRemoved, extraData=event.fitID)
         self.ctrlPanel.OnFitRemoved(event)
-        self.draw()
+        self.scheduleDraw()
 
     # Target profile events
     def OnProfileRenamed(self, event):
         event.Skip()
         self.ctrlPanel.OnProfileRenamed(event)
-        self.draw()
+        self.scheduleDraw()
 
     def OnProfileChanged(self, event):
         event.Skip()
         self.clearCache(reason=GraphCacheCleanupReason.profileChanged, extraData=event.profileID)
         self.ctrlPanel.OnProfileChanged(event)
-        self.draw()
+        self.scheduleDraw()
 
     def OnProfileRemoved(self, event):
         event.Skip()
         self.clearCache(reason=GraphCacheCleanupReason.profileRemoved, extraData=event.profileID)
         self.ctrlPanel.OnProfileRemoved(event)
-        self.draw()
+        self.scheduleDraw()
 
     def OnResistModeChanged(self, event):
         event.Skip()
         for fitID in event.fitIDs:
             self.clearCache(reason=GraphCacheCleanupReason.resistModeChanged, extraData=fitID)
         self.ctrlPanel.OnResistModeChanged(event)
-        self.draw()
+        self.scheduleDraw()
 
     def OnGraphOptionChanged(self, event):
         event.Skip()
@@ -182,7 +189,7 @@ class GraphFrame(AuxiliaryFrame):
             self.Layout()
             self.ctrlPanel.Thaw()
         self.clearCache(reason=GraphCacheCleanupReason.optionChanged)
-        self.draw()
+        self.scheduleDraw()
 
     def OnEffectiveHpToggled(self, event):
         event.Skip()
@@ -195,12 +202,12 @@ class GraphFrame(AuxiliaryFrame):
             self.clearCache(reason=GraphCacheCleanupReason.hpEffectivityChanged)
             # Data has to be recalculated - delay redraw
             # to give time to finish UI update in main window
-            self.drawTimer.Stop()
-            self.drawTimer.Start(REDRAW_DELAY, True)
-        # Even if graph is not selected, keep it updated
+            self.scheduleDraw(REDRAW_DELAY)
+        # Even if graph is not selected, keep it updated. Views which haven't
+        # been instantiated yet will pick up current value on instantiation
         for idx in range(self.graphSelection.GetCount()):
-            view = self.getView(idx=idx)
-            if view is currentView:
+            view = self.graphSelection.GetClientData(idx)
+            if view is currentView or isinstance(view, type):
                 continue
             if view.usesHpEffectivity:
                 view.isEffective = event.effective
@@ -218,7 +225,30 @@ class GraphFrame(AuxiliaryFrame):
         event.Skip()
         self.draw()
 
+    def OnShow(self, event):
+        event.Skip()
+        if event.IsShown() and self._drawPending:
+            self._drawPending = False
+            self.canvasPanel.draw()
+
     def OnClose(self, event):
+        self.drawTimer.Stop()
+        self.canvasPanel.releaseCanvas()
+        self._unbindExternal()
+        event.Skip()
+
+    def _bindExternal(self):
+        self.mainFrame.Bind(GE.FIT_RENAMED, self.OnFitRenamed)
+        self.mainFrame.Bind(GE.FIT_CHANGED, self.OnFitChanged)
+        self.mainFrame.Bind(GE.FIT_REMOVED, self.OnFitRemoved)
+        self.mainFrame.Bind(GE.TARGET_PROFILE_RENAMED, self.OnProfileRenamed)
+        self.mainFrame.Bind(GE.TARGET_PROFILE_CHANGED, self.OnProfileChanged)
+        self.mainFrame.Bind(GE.TARGET_PROFILE_REMOVED, self.OnProfileRemoved)
+        self.mainFrame.Bind(RESIST_MODE_CHANGED, self.OnResistModeChanged)
+        self.mainFrame.Bind(GE.GRAPH_OPTION_CHANGED, self.OnGraphOptionChanged)
+        self.mainFrame.Bind(GE.EFFECTIVE_HP_TOGGLED, self.OnEffectiveHpToggled)
+
+    def _unbindExternal(self):
         self.mainFrame.Unbind(GE.FIT_RENAMED, handler=self.OnFitRenamed)
         self.mainFrame.Unbind(GE.FIT_CHANGED, handler=self.OnFitChanged)
         self.mainFrame.Unbind(GE.FIT_REMOVED, handler=self.OnFitRemoved)
@@ -228,18 +258,86 @@ class GraphFrame(AuxiliaryFrame):
         self.mainFrame.Unbind(RESIST_MODE_CHANGED, handler=self.OnResistModeChanged)
         self.mainFrame.Unbind(GE.GRAPH_OPTION_CHANGED, handler=self.OnGraphOptionChanged)
         self.mainFrame.Unbind(GE.EFFECTIVE_HP_TOGGLED, handler=self.OnEffectiveHpToggled)
-        event.Skip()
 
     def getView(self, idx=None):
         if idx is None:
             idx = self.graphSelection.GetSelection()
-        return self.graphSelection.GetClientData(idx)
+        view = self.graphSelection.GetClientData(idx)
+        if isinstance(view, type):
+            view = view()
+            self.graphSelection.SetClientData(idx, view)
+        return view
+
+    def getPlotPoints(self, mainInput, miscInputs, xSpec, ySpec, src, tgt=None):
+        view = self.getView()
+        if tgt is None:
+            tgtType = tgtItemID = resistMode = None
+        else:
+            tgtType = 'fit' if tgt.isFit else 'profile'
+            tgtItemID = tgt.item.ID
+            resistMode = tgt.resistMode
+        cacheKey = (view.internalName, mainInput, tuple(miscInputs), xSpec, ySpec, src.item.ID, tgtType, tgtItemID, resistMode)
+        try:
+            return self._plotPointCache[cacheKey]
+        except KeyError:
+            pass
+        plotData = view.getPlotPoints(
+            mainInput=mainInput, miscInputs=miscInputs,
+            xSpec=xSpec, ySpec=ySpec, src=src, tgt=tgt)
+        # Evict oldest entry to keep cache bounded when user goes through many inputs
+        if len(self._plotPointCache) >= PLOT_CACHE_SIZE:
+            del self._plotPointCache[next(iter(self._plotPointCache))]
+        self._plotPointCache[cacheKey] = plotData
+        return plotData
 
     def clearCache(self, reason, extraData=None):
         self.getView().clearCache(reason, extraData)
+        self._clearPlotPointCache(reason, extraData)
+        # Redraw only if cleanup concerns something which is on the graph
+        if self._isDisplayAffected(reason, extraData):
+            self.canvasPanel.markDirty()
+
+    def _isDisplayAffected(self, reason, extraData):
+        # Only fit, profile and resist mode changes can be narrowed down to specific items
+        if reason not in (
+                GraphCacheCleanupReason.fitChanged, GraphCacheCleanupReason.fitRemoved,
+                GraphCacheCleanupReason.profileChanged, GraphCacheCleanupReason.profileRemoved,
+                GraphCacheCleanupReason.resistModeChanged
+        ):
+            return True
+        for src in self.ctrlPanel.sources:
+            if isCacheKeyAffected(reason, extraData, src.item.ID, None, None):
+                return True
+        for tgt in self.ctrlPanel.targets:
+            if isCacheKeyAffected(reason, extraData, None, 'fit' if tgt.isFit else 'profile', tgt.item.ID):
+                return True
+        return False
+
+    def _clearPlotPointCache(self, reason, extraData):
+        # Inputs are part of cache key, no need to clear anything
+        if reason == GraphCacheCleanupReason.inputChanged:
+            return
+        for cacheKey in [k for k in self._plotPointCache if isCacheKeyAffected(reason, extraData, *k[5:8])]:
+            del self._plotPointCache[cacheKey]
+
+    def scheduleDraw(self, delay=COALESCE_DELAY):
+        # Coalesce bursts of events into single redraw, keeping
+        # longer delay if it has been requested already
+        if self.drawTimer.IsRunning():
+            delay = max(delay, self.drawTimer.GetInterval())
+        self.drawTimer.Stop()
+        self.drawTimer.Start(delay, True)
 
     def draw(self):
+        self.drawTimer.Stop()
+        # Do not render into window nobody can see, catch up when it's shown instead
+        if not self.IsShownOnScreen():
+            self._drawPending = True
+            return
         self.canvasPanel.draw()
 
+    def refreshLegend(self):
+        self.canvasPanel.refreshLegend()
+
     def resetXMark(self):
         self.canvasPanel.xMark = None
@@ -0,0 +1,39 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+
+import math
+
+
+def getLimits(minVal, maxVal, minExtra=0, maxExtra=0):
+    """Get axis range which shows passed values, extended by passed fractions of their range."""
+    # No data - infinite bounds
+    if not math.isfinite(minVal) or not math.isfinite(maxVal):
+        minVal = maxVal = 0
+    minVal = float(minVal)
+    maxVal = float(maxVal)
+    valRange = maxVal - minVal
+    # Extend by % of value if we show function of a constant; if
+    # function is 0, spread out visual space as special case
+    if valRange == 0:
+        spread = abs(minVal) * 0.05 or 5
+        return minVal - spread, maxVal + spread
+    # Extend range a little for some visual space
+    return minVal - valRange * minExtra, maxVal + valRange * maxExtra
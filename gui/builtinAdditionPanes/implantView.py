@@ -133,8 +133,13 @@ class ImplantDisplay(d.Display):
 
     def __init__(self, parent):
         d.Display.__init__(self, parent, style=wx.BORDER_NONE)
+        # Column set is static, no need to look it up on every click
+        self._stateColIdx = self.getColIndex(State)
 
         self.lastFitId = None
+        self.lastStuffIds = None
+        # Format: {id(implant): position in fit's implant list}
+        self._implantIndex = {}
 
         self.mainFrame.Bind(GE.FIT_CHANGED, self.fitChanged)
         self.mainFrame.Bind(ITEM_SELECTED, self.addItem)
@@ -187,12 +192,14 @@ class ImplantDisplay(d.Display):
         if activeFitID is None and self.lastFitId is not None:
             self.DeleteAllItems()
             self.lastFitId = None
+            self.lastStuffIds = None
             return
 
         self.original = fit.appliedImplants if fit is not None else None
         self.implants = fit.appliedImplants[:] if fit is not None else None
         if self.implants is not None:
             self.implants.sort(key=lambda implant: implant.slot or 0)
+        self._implantIndex = {id(implant): idx for idx, implant in enumerate(self.original or ())}
 
         if activeFitID != self.lastFitId:
             self.lastFitId = activeFitID
@@ -204,7 +211,37 @@ class ImplantDisplay(d.Display):
 
             self.unselectAll()
 
-        self.update(self.implants)
+        # Avoid repainting list after every inserted or changed row
+        self.Freeze()
+        try:
+            self.update(self.implants)
+        finally:
+            self.Thaw()
+
+    def populate(self, stuff):
+        # Insert and delete rows only where implant list has actually changed; rows
+        # which stayed in place keep their contents and do not have to be rewritten
+        lastIds = self.lastStuffIds
+        stuffIds = None if stuff is None else [id(i) for i in stuff]
+        self.lastStuffIds = stuffIds
+        if stuffIds is None or lastIds is None or self.GetItemCount() != len(lastIds):
+            super().populate(stuff)
+            return
+        if stuffIds == lastIds:
+            return
+        maxCommon = min(len(lastIds), len(stuffIds))
+        prefix = 0
+        while prefix < maxCommon and lastIds[prefix] == stuffIds[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < maxCommon - prefix and lastIds[-1 - suffix] == stuffIds[-1 - suffix]:
+            suffix += 1
+        oldChanged = len(lastIds) - prefix - suffix
+        newChanged = len(stuffIds) - prefix - suffix
+        for _ in range(oldChanged - newChanged):
+            self.DeleteItem(prefix)
+        for _ in range(newChanged - oldChanged):
+            self.InsertItem(prefix, "")
 
     def addItem(self, event):
         item = Market.getInstance().getItem(event.itemID, eager='group.category')
@@ -230,7 +267,7 @@ class ImplantDisplay(d.Display):
         row, _ = self.HitTest(event.Position)
         if row != -1:
             col = self.getColumn(event.Position)
-            if col != self.getColIndex(State):
+            if col != self._stateColIdx:
                 try:
                     implant = self.implants[row]
                 except IndexError:
@@ -244,10 +281,17 @@ class ImplantDisplay(d.Display):
             return
         positions = []
         for implant in implants:
-            if implant in self.original:
-                positions.append(self.original.index(implant))
+            position = self._getPosition(implant)
+            if position is not None:
+                positions.append(position)
         self.mainFrame.command.Submit(cmd.GuiRemoveImplantsCommand(fitID=fitID, positions=positions))
 
+    def _getPosition(self, implant):
+        position = self._implantIndex.get(id(implant))
+        if position is None and self.original is not None and implant in self.original:
+            position = self.original.index(implant)
+        return position
+
     def click(self, event):
         fitID = self.mainFrame.getActiveFit()
         fit = Fit.getInstance().getFit(fitID)
@@ -255,22 +299,23 @@ class ImplantDisplay(d.Display):
             mainRow, _ = self.HitTest(event.Position)
             if mainRow != -1:
                 col = self.getColumn(event.Position)
-                if col == self.getColIndex(State):
+                if col == self._stateColIdx:
                     fitID = self.mainFrame.getActiveFit()
                     try:
                         mainImplant = self.implants[mainRow]
                     except IndexError:
                         return
-                    if mainImplant in self.original:
-                        mainPosition = self.original.index(mainImplant)
+                    mainPosition = self._getPosition(mainImplant)
+                    if mainPosition is not None:
                         positions = []
                         for row in self.getSelectedRows():
                             try:
                                 implant = self.implants[row]
                             except IndexError:
                                 continue
-                            if implant in self.original:
-                                positions.append(self.original.index(implant))
+                            position = self._getPosition(implant)
+                            if position is not None:
+                                positions.append(position)
                         if mainPosition not in positions:
                             positions = [mainPosition]
                         self.mainFrame.command.Submit(cmd.GuiToggleImplantStatesCommand(
@@ -292,7 +337,7 @@ class ImplantDisplay(d.Display):
             except IndexError:
                 pass
             else:
-                if implant in self.original:
+                if self._getPosition(implant) is not None:
                     mainImplant = implant
         fitID = self.mainFrame.getActiveFit()
         fit = Fit.getInstance().getFit(fitID)
@@ -96,7 +96,7 @@ class MainMenuBar(wx.MenuBar):
         graphFrameItem = wx.MenuItem(fitMenu, self.graphFrameId, "&Graphs\tCTRL+G")
         graphFrameItem.SetBitmap(BitmapLoader.getBitmap("graphs_small", "gui"))
         fitMenu.Append(graphFrameItem)
-        if not graphs.graphFrame_enabled:
+        if not graphs.graphFrameAvailable():
             self.Enable(self.graphFrameId, False)
         self.ignoreRestrictionItem = fitMenu.Append(self.toggleIgnoreRestrictionID, "Disable Fitting Re&strictions")
 
@@ -0,0 +1,59 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import importlib.util
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+sys.path.append(root_dir)
+
+from service.const import GraphCacheCleanupReason
+
+
+# Load module directly, as importing graphs package pulls in wx
+_spec = importlib.util.spec_from_file_location('_graphBase', os.path.join(root_dir, 'graphs', 'data', 'base', 'graph.py'))
+_graphBase = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_graphBase)
+isCacheKeyAffected = _graphBase.isCacheKeyAffected
+
+
+def test_fitChanged_source():
+    for reason in (GraphCacheCleanupReason.fitChanged, GraphCacheCleanupReason.fitRemoved):
+        assert isCacheKeyAffected(reason, 1, 1, None, None)
+        assert isCacheKeyAffected(reason, 1, 1, 'profile', 1)
+        assert not isCacheKeyAffected(reason, 1, 2, None, None)
+
+
+def test_fitChanged_target():
+    for reason in (GraphCacheCleanupReason.fitChanged, GraphCacheCleanupReason.fitRemoved):
+        assert isCacheKeyAffected(reason, 1, 2, 'fit', 1)
+        assert not isCacheKeyAffected(reason, 1, 2, 'fit', 3)
+        # Profile with the same ID as the fit is a different item
+        assert not isCacheKeyAffected(reason, 1, 2, 'profile', 1)
+
+
+def test_profileChanged():
+    for reason in (GraphCacheCleanupReason.profileChanged, GraphCacheCleanupReason.profileRemoved):
+        assert isCacheKeyAffected(reason, 1, 2, 'profile', 1)
+        assert not isCacheKeyAffected(reason, 1, 2, 'profile', 3)
+        assert not isCacheKeyAffected(reason, 1, 2, 'fit', 1)
+        assert not isCacheKeyAffected(reason, 1, 1, None, None)
+
+
+def test_resistModeChanged():
+    reason = GraphCacheCleanupReason.resistModeChanged
+    assert isCacheKeyAffected(reason, 1, 2, 'fit', 1)
+    assert not isCacheKeyAffected(reason, 1, 2, 'fit', 3)
+    assert not isCacheKeyAffected(reason, 1, 2, 'profile', 1)
+    # Resist mode of source fit does not matter
+    assert not isCacheKeyAffected(reason, 1, 1, None, None)
+
+
+def test_otherReasons():
+    for reason in (
+            GraphCacheCleanupReason.graphSwitched, GraphCacheCleanupReason.inputChanged,
+            GraphCacheCleanupReason.optionChanged, GraphCacheCleanupReason.hpEffectivityChanged
+    ):
+        assert isCacheKeyAffected(reason, None, 1, None, None)
+        assert isCacheKeyAffected(reason, None, 1, 'fit', 2)
+        assert isCacheKeyAffected(reason, None, 1, 'profile', 2)
@@ -0,0 +1,187 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('wx')
+pytest.importorskip('matplotlib')
+
+from graphs.data.base import XDef, YDef
+from graphs.gui import canvasPanel
+from graphs.gui.canvasPanel import GraphCanvasPanel
+from graphs.gui.frame import GraphFrame
+from service.const import GraphCacheCleanupReason, GraphColor
+
+
+@pytest.fixture(scope='module', autouse=True)
+def matplotlib_imported():
+    assert canvasPanel.importMatplotlib()
+
+
+class FakeGraphFrame:
+
+    def __init__(self, sources):
+        self.plotCalls = 0
+        self.view = SimpleNamespace(internalName='test', hasTargets=False)
+        self.ctrlPanel = SimpleNamespace(
+            xType=XDef(handle='time', unit='s', label='Time', mainInput=('time', 's')),
+            yType=YDef(handle='dps', unit=None, label='DPS'),
+            getValues=lambda: (('time', 's', (0, 10)), []),
+            sources=sources, targets=[], showLegend=True, showY0=True,
+            formatLabel=lambda axisDef: axisDef.label)
+
+    def getView(self):
+        return self.view
+
+    def getPlotPoints(self, mainInput, miscInputs, xSpec, ySpec, src, tgt=None):
+        self.plotCalls += 1
+        return [0, 5, 10], [src.item.ID, src.item.ID * 2, src.item.ID * 3]
+
+
+class FakeSource:
+
+    def __init__(self, itemID, colorID=GraphColor.red):
+        self.item = SimpleNamespace(ID=itemID)
+        self.colorID = colorID
+        self.name = self.shortName = str(itemID)
+
+
+def makePanel(graphFrame):
+    # Canvas panel logic without wx window, drawing on agg canvas
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    panelClass = type('HeadlessCanvasPanel', (), {k: v for k, v in vars(GraphCanvasPanel).items() if not k.startswith('__')})
+    panel = panelClass()
+    panel.graphFrame = graphFrame
+    panel.figure = canvasPanel.Figure()
+    panel.canvas = FigureCanvasAgg(panel.figure)
+    panel.subplot = panel.figure.add_subplot(111)
+    panel.Refresh = lambda: None
+    panel.xMark = None
+    panel.legend = None
+    panel.background = None
+    panel._styleCache = {}
+    panel._legendLineCache = {}
+    panel._lastStateKey = None
+    panel._forceRedraw = False
+    panel._lineCollections = None
+    panel._decorations = []
+    return panel
+
+
+def test_makeSegment_short():
+    np = canvasPanel.np
+    xs = np.arange(5, dtype=float)
+    ys = xs * 2
+    segment = GraphCanvasPanel._makeSegment(xs, ys, maxPoints=10)
+    assert segment.shape == (5, 2)
+    assert segment[:, 0].tolist() == xs.tolist()
+    assert segment[:, 1].tolist() == ys.tolist()
+
+
+def test_makeSegment_downsampled():
+    np = canvasPanel.np
+    xs = np.arange(1001, dtype=float)
+    ys = xs * 2
+    segment = GraphCanvasPanel._makeSegment(xs, ys, maxPoints=100)
+    assert len(segment) <= 101
+    # First and last points are always kept
+    assert segment[0].tolist() == [0, 0]
+    assert segment[-1].tolist() == [1000, 2000]
+    assert (segment[:, 1] == segment[:, 0] * 2).all()
+
+
+def test_updateLines_reuse():
+    panel = makePanel(FakeGraphFrame([]))
+    styleKey = ((1, 0, 0), 'solid')
+    panel._updateLines({styleKey: [[(0, 0), (1, 1)]]}, [])
+    lineCollection = panel._lineCollections[styleKey]
+    # Same styles - existing collection gets new data
+    panel._updateLines({styleKey: [[(0, 0), (1, 2)], [(0, 1), (1, 3)]]}, [])
+    assert panel._lineCollections[styleKey] is lineCollection
+    assert len(lineCollection.get_segments()) == 2
+    assert list(panel.subplot.collections) == [lineCollection]
+
+
+def test_updateLines_rebuild():
+    panel = makePanel(FakeGraphFrame([]))
+    styleKey1 = ((1, 0, 0), 'solid')
+    styleKey2 = ((0, 0, 1), 'solid')
+    panel._updateLines({styleKey1: [[(0, 0), (1, 1)]]}, [])
+    lineCollection = panel._lineCollections[styleKey1]
+    # Changed styles - plot is rebuilt
+    panel._updateLines({styleKey2: [[(0, 0), (1, 1)]]}, [])
+    assert list(panel._lineCollections) == [styleKey2]
+    assert lineCollection not in panel.subplot.collections
+    assert len(panel.subplot.collections) == 1
+
+
+def test_draw_skipUnchanged():
+    graphFrame = FakeGraphFrame([FakeSource(1), FakeSource(2, GraphColor.blue)])
+    panel = makePanel(graphFrame)
+    panel.draw()
+    assert graphFrame.plotCalls == 2
+    assert panel.legend is not None
+    panel.draw()
+    assert graphFrame.plotCalls == 2
+    panel.markDirty()
+    panel.draw()
+    assert graphFrame.plotCalls == 4
+    # Changed options are part of state
+    graphFrame.ctrlPanel.showY0 = False
+    panel.draw()
+    assert graphFrame.plotCalls == 6
+
+
+def test_draw_resized():
+    graphFrame = FakeGraphFrame([FakeSource(1)])
+    panel = makePanel(graphFrame)
+    panel.draw()
+    panel.draw()
+    assert graphFrame.plotCalls == 1
+    # Lines are downsampled to axes width, so they are redone on resize
+    panel.figure.set_size_inches(panel.figure.get_size_inches() * 2)
+    panel.draw()
+    assert graphFrame.plotCalls == 2
+
+
+def test_plotPointCache():
+    plotCalls = []
+
+    def getPlotPoints(mainInput, miscInputs, xSpec, ySpec, src, tgt):
+        plotCalls.append((src.item.ID, tgt))
+        return [0, 1], [2, 3]
+
+    view = SimpleNamespace(internalName='test', getPlotPoints=getPlotPoints)
+    graphFrame = SimpleNamespace(_plotPointCache={}, getView=lambda: view)
+    source = FakeSource(1)
+    target = SimpleNamespace(item=SimpleNamespace(ID=2), isFit=True, resistMode=None)
+
+    def getPoints(tgt=None, mainInput=('time', 's', (0, 10))):
+        return GraphFrame.getPlotPoints(
+            graphFrame, mainInput=mainInput, miscInputs=[], xSpec='time', ySpec='dps', src=source, tgt=tgt)
+
+    assert getPoints() == ([0, 1], [2, 3])
+    getPoints()
+    getPoints(target)
+    getPoints(target)
+    assert len(plotCalls) == 2
+    # Inputs are part of the key
+    getPoints(mainInput=('time', 's', (0, 20)))
+    GraphFrame._clearPlotPointCache(graphFrame, GraphCacheCleanupReason.inputChanged, None)
+    getPoints()
+    assert len(plotCalls) == 3
+    # Unrelated fit keeps cache, target fit change drops only lines with it
+    GraphFrame._clearPlotPointCache(graphFrame, GraphCacheCleanupReason.fitChanged, 3)
+    GraphFrame._clearPlotPointCache(graphFrame, GraphCacheCleanupReason.fitChanged, 2)
+    getPoints()
+    assert len(plotCalls) == 3
+    getPoints(target)
+    assert len(plotCalls) == 4
+    GraphFrame._clearPlotPointCache(graphFrame, GraphCacheCleanupReason.graphSwitched, None)
+    assert graphFrame._plotPointCache == {}
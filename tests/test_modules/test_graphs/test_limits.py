@@ -0,0 +1,35 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import importlib.util
+import math
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+sys.path.append(root_dir)
+
+
+# Load module directly, as importing graphs package pulls in wx
+_spec = importlib.util.spec_from_file_location('_graphLimits', os.path.join(root_dir, 'graphs', 'gui', 'limits.py'))
+_graphLimits = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_graphLimits)
+getLimits = _graphLimits.getLimits
+
+
+def test_getLimits_range():
+    assert getLimits(0, 100, minExtra=0.05, maxExtra=0.1) == (-5, 110)
+    assert getLimits(-100, 100) == (-100, 100)
+
+
+def test_getLimits_constant():
+    assert getLimits(100, 100) == (95, 105)
+    assert getLimits(-100, -100) == (-105, -95)
+
+
+def test_getLimits_zero():
+    assert getLimits(0, 0) == (-5, 5)
+
+
+def test_getLimits_noData():
+    assert getLimits(math.inf, -math.inf) == (-5, 5)
+    assert getLimits(0, math.nan) == (-5, 5)